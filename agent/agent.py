@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import os
@@ -5,6 +6,7 @@ import uuid
 from typing import Optional
 
 import aiohttp
+import orjson
 from dotenv import load_dotenv
 from livekit import rtc
 from livekit.agents import (
@@ -18,10 +20,8 @@ from livekit.agents import (
     inference,
     llm,
     room_io,
-    utils,
 )
 from livekit.plugins import noise_cancellation, silero
-from livekit.plugins.turn_detector.multilingual import MultilingualModel
 
 logger = logging.getLogger("jobnova-router")
 logging.basicConfig(level=logging.INFO)
@@ -33,9 +33,36 @@ BACKEND_BASE_URL = os.getenv("BACKEND_BASE_URL", "http://127.0.0.1:8000").rstrip
 INGEST_SECRET = os.getenv("INGEST_SECRET", "")
 AGENT_NAME = os.getenv("AGENT_NAME", "Taylor-23fe")
 
+# One shared HTTP session per process — keep-alive to the backend so turns
+# don't pay TCP/TLS handshakes. Lives for the whole process; aiohttp reaps
+# idle connections via keepalive_timeout.
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_http_session() -> aiohttp.ClientSession:
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=32,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+                ttl_dns_cache=300,
+            ),
+            headers={"Connection": "keep-alive"},
+        )
+    return _http_session
 
-async def call_engine(session_id: str, event_type: str, user_text: str = "") -> dict:
-    """Calls Django /api/interview/engine/next_turn/ and returns parsed JSON."""
+
+# Per-phase timeouts: a stuck connect fails in 2s instead of eating the whole
+# 30s budget; sock_read bounds the gap between streamed chunks.
+_ENGINE_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=2, sock_connect=2, sock_read=10)
+
+
+async def call_engine_stream(session_id: str, event_type: str, user_text: str = ""):
+    """Calls Django /api/interview/engine/next_turn/ and yields assistant text
+    chunks (sentence-bounded) as the backend streams them."""
     url = f"{BACKEND_BASE_URL}/api/interview/engine/next_turn/"
     headers = {
         "Content-Type": "application/json",
@@ -48,26 +75,79 @@ async def call_engine(session_id: str, event_type: str, user_text: str = "") ->
         "event_id": str(uuid.uuid4()),
     }
 
-    session = utils.http_context.http_session()
-    timeout = aiohttp.ClientTimeout(total=30)
-    async with session.post(url, timeout=timeout, headers=headers, json=payload) as resp:
-        txt = await resp.text()
-        if resp.status >= 400:
-            raise ToolError(f"engine HTTP {resp.status}: {txt[:300]}")
+    session = _get_http_session()
+    yielded = False
+    for attempt in (0, 1):
         try:
-            return json.loads(txt)
-        except json.JSONDecodeError:
-            raise ToolError(f"engine returned non-JSON: {txt[:300]}")
+            async with session.post(url, timeout=_ENGINE_TIMEOUT, headers=headers, data=orjson.dumps(payload)) as resp:
+                if resp.status >= 400:
+                    txt = await resp.text()
+                    raise ToolError(f"engine HTTP {resp.status}: {txt[:300]}")
+
+                ctype = resp.headers.get("Content-Type", "")
+                if "ndjson" not in ctype:
+                    # Buffered JSON (idempotent replay / older backend)
+                    raw = await resp.read()
+                    try:
+                        out = orjson.loads(raw)
+                    except orjson.JSONDecodeError:
+                        raise ToolError(f"engine returned non-JSON: {raw[:300]!r}")
+                    text = (out.get("assistant_text") or "").strip()
+                    if text:
+                        yield text
+                    return
+
+                streamed = False
+                async for line in resp.content:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        event = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        logger.warning("engine stream: skipping bad line %r", line[:120])
+                        continue
+                    if event.get("type") == "delta":
+                        text = event.get("text") or ""
+                        if text:
+                            streamed = True
+                            yielded = True
+                            yield text
+                    elif event.get("type") == "final" and not streamed:
+                        # Stream produced no deltas (e.g. fallback) — speak final text
+                        text = (event.get("assistant_text") or "").strip()
+                        if text:
+                            yielded = True
+                            yield text
+                return
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            # Retry once, but never after chunks already reached TTS —
+            # the backend's event_id idempotency covers the server side.
+            if attempt == 0 and not yielded:
+                logger.warning(f"engine connect failed ({e!r}); retrying once")
+                continue
+            raise ToolError(f"engine unreachable: {e!r}")
+
+
+async def call_engine(session_id: str, event_type: str, user_text: str = "") -> dict:
+    """Drains the engine stream and returns the full reply (for on_enter)."""
+    parts = []
+    async for chunk in call_engine_stream(session_id, event_type, user_text):
+        parts.append(chunk)
+    return {"assistant_text": "".join(parts).strip()}
 
 
 class RouterAgent(Agent):
     """Thin router: speaks only assistant_text returned by backend."""
-    def __init__(self, metadata: str) -> None:
+    def __init__(self, metadata: str, start_fut: Optional["asyncio.Task"] = None) -> None:
         super().__init__(instructions="You are a thin router. Do not improvise.")
         self.meta_raw = metadata or "{}"
         self.session_id: Optional[str] = None
         self._did_start = False
         self._pending_user_text: Optional[str] = None
+        # Pre-fired "start" turn (scheduled in entrypoint) so the first Gemini
+        # call overlaps LiveKit room setup instead of adding dead air.
+        self._start_fut = start_fut
 
     def _parse_session_id(self) -> str:
         try:
@@ -85,10 +165,18 @@ class RouterAgent(Agent):
         # Start interview immediately
         if not self._did_start:
             self._did_start = True
-            out = await call_engine(self.session_id, "start", "")
-            text = (out.get("assistant_text") or "").strip()
-            if text:
-                await self.session.say(text, allow_interruptions=False)
+            if self._start_fut is not None:
+                out = await self._start_fut
+                text = (out.get("assistant_text") or "").strip()
+                if text:
+                    await self.session.say(text, allow_interruptions=False)
+            else:
+                # No prewarmed turn — feed the stream straight into say() so
+                # TTS starts on the first sentence, not on generation end
+                await self.session.say(
+                    call_engine_stream(self.session_id, "start", ""),
+                    allow_interruptions=False,
+                )
 
     async def on_user_turn_completed(self, turn_ctx: llm.ChatContext, new_message: llm.ChatMessage) -> None:
         # FIX: text_content is a property in Python (string), not a function.
@@ -114,14 +202,18 @@ class RouterAgent(Agent):
         if not user_text:
             return
 
-        out = await call_engine(self.session_id, "user_turn", user_text)
-        text = (out.get("assistant_text") or "").strip()
-        if text:
-            yield text
+        # Pipeline each sentence into TTS as it arrives from the backend
+        async for chunk in call_engine_stream(self.session_id, "user_turn", user_text):
+            yield chunk
 
 
 server = AgentServer()
 
+# Keep prewarmed processes around so new rooms fork from a parent that has
+# the silero weights resident (shared copy-on-write) instead of paying the
+# model load per job.
+server.num_idle_processes = int(os.getenv("AGENT_IDLE_PROCESSES", str(os.cpu_count() or 1)))
+
 
 def prewarm(proc: JobProcess):
     proc.userdata["vad"] = silero.VAD.load()
@@ -132,6 +224,23 @@ server.setup_fnc = prewarm
 
 @server.rtc_session(agent_name=AGENT_NAME)
 async def entrypoint(ctx: JobContext):
+    # Imported lazily so idle/parent processes stay small; the job process
+    # pays this once per fork, not the whole server.
+    from livekit.plugins.turn_detector.multilingual import MultilingualModel
+
+    meta = {}
+    try:
+        meta = json.loads(ctx.job.metadata or "{}")
+    except Exception as e:
+        logger.warning(f"bad job metadata: {e}")
+
+    # Fire the "start" turn now so Gemini generates while the room connects;
+    # on_enter just awaits the result.
+    start_fut: Optional[asyncio.Task] = None
+    sid = (meta.get("session_id") or "").strip()
+    if sid:
+        start_fut = asyncio.create_task(call_engine(sid, "start", ""))
+
     session = AgentSession(
         stt=inference.STT(model="deepgram/nova-3", language="en"),
         # This is required by the pipeline; we override llm_node so it won't improvise.
@@ -142,9 +251,11 @@ async def entrypoint(ctx: JobContext):
         turn_detection=MultilingualModel(),
         vad=ctx.proc.userdata["vad"],
 
-        # Your UX requirement: give ~6s pause before finalizing a turn
-        min_endpointing_delay=6.0,
-        max_endpointing_delay=8.0,
+        # Let the turn detector + VAD decide adaptively; it holds longer on
+        # its own when the model predicts mid-utterance. Sessions that need
+        # long pauses can override via job metadata.
+        min_endpointing_delay=float(meta.get("min_endpointing_delay", 1.2)),
+        max_endpointing_delay=float(meta.get("max_endpointing_delay", 3.5)),
 
         # Avoid silence/deadlock from barge-in while stabilizing
         allow_interruptions=False,
@@ -153,7 +264,7 @@ async def entrypoint(ctx: JobContext):
     )
 
     await session.start(
-        agent=RouterAgent(metadata=ctx.job.metadata),
+        agent=RouterAgent(metadata=ctx.job.metadata, start_fut=start_fut),
         room=ctx.room,
         room_options=room_io.RoomOptions(
             audio_input=room_io.AudioInputOptions(
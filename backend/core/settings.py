@@ -71,6 +71,11 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'core.wsgi.application'
 
+# Serve the async views (next_turn streams Gemini output) under ASGI:
+#   uvicorn core.asgi:application --workers N
+# A sync WSGI worker would block for the whole Gemini call per turn.
+ASGI_APPLICATION = 'core.asgi.application'
+
 
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
@@ -82,6 +87,39 @@ DATABASES = {
     }
 }
 
+# Point POSTGRES_DB at a database to swap sqlite for psycopg v3 with a bounded
+# connection pool, so N concurrent rooms share a small pool instead of opening
+# a connection per request. Django disallows CONN_MAX_AGE with "pool" — the
+# pool owns connection lifetimes.
+if os.getenv("POSTGRES_DB"):
+    DATABASES['default'] = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.getenv("POSTGRES_DB"),
+        'USER': os.getenv("POSTGRES_USER", "postgres"),
+        'PASSWORD': os.getenv("POSTGRES_PASSWORD", ""),
+        'HOST': os.getenv("POSTGRES_HOST", "127.0.0.1"),
+        'PORT': os.getenv("POSTGRES_PORT", "5432"),
+        'OPTIONS': {
+            'pool': {
+                'min_size': int(os.getenv("DB_POOL_MIN_SIZE", "4")),
+                'max_size': int(os.getenv("DB_POOL_MAX_SIZE", "20")),
+            },
+            # bound how long a turn's FOR UPDATE lock can stall a statement
+            'options': f"-c statement_timeout={os.getenv('DB_STATEMENT_TIMEOUT_MS', '5000')}",
+        },
+    }
+
+
+# Point REDIS_URL at a Redis instance to share the idempotency/token caches
+# across workers; per-process LocMem (Django's default) otherwise.
+if os.getenv("REDIS_URL"):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv("REDIS_URL"),
+        }
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -126,4 +164,7 @@ LIVEKIT_API_SECRET = os.getenv("LIVEKIT_API_SECRET", "")
 INGEST_SECRET = os.getenv("INGEST_SECRET", "")
 INTRO_TIMEOUT_S = int(os.getenv("INTRO_TIMEOUT_S", "90"))
 EXPERIENCE_TIMEOUT_S = int(os.getenv("EXPERIENCE_TIMEOUT_S", "180"))
+HISTORY_MAX_MESSAGES = int(os.getenv("HISTORY_MAX_MESSAGES", "40"))
+HISTORY_SUMMARY_CHARS = int(os.getenv("HISTORY_SUMMARY_CHARS", "6000"))
+HISTORY_KEEP_RECENT = int(os.getenv("HISTORY_KEEP_RECENT", "10"))
 AGENT_NAME = os.getenv("AGENT_NAME", "Taylor-23fe")
\ No newline at end of file
@@ -14,6 +14,8 @@ with hard guard-rails as fallback.
 """
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import os
 import re
@@ -43,14 +45,24 @@ MODEL_NAME = getattr(settings, "GEMINI_MODEL", None) or os.getenv("GEMINI_MODEL"
 TEMPERATURE = float(os.getenv("GEMINI_TEMPERATURE", "0.7"))
 MAX_TOKENS = int(os.getenv("GEMINI_MAX_OUTPUT_TOKENS", "280"))
 
+# Hedging: if the primary model hasn't produced a first token within the
+# delay, race a cheaper fallback model and keep whichever streams first.
+FALLBACK_MODEL_NAME = os.getenv("GEMINI_FALLBACK_MODEL", "gemini-2.5-flash-lite")
+HEDGE_DELAY_S = float(os.getenv("GEMINI_HEDGE_DELAY_S", "0.5"))
+
 # Guard-rails
 MAX_INTRO_TURNS = int(os.getenv("MAX_INTRO_TURNS", "7"))
 MAX_EXP_TURNS = int(os.getenv("MAX_EXP_TURNS", "14"))
 
+# Retry policy for rate-limited Gemini calls
+MAX_RETRIES = 1
+RETRY_WAIT = 8  # seconds — quick retry, then fallback
+
 
 # ---------------------------------------------------------------------------
 # System prompt — the interviewer persona
 # ---------------------------------------------------------------------------
+@functools.lru_cache(maxsize=1024)
 def _system_prompt(name: str, role: str, stage: str) -> str:
     return f"""You are Taylor, a senior technical interviewer. You are warm, sharp, and professional.
 
@@ -100,87 +112,198 @@ You MUST include exactly one signal at the end of every reply."""
 # ---------------------------------------------------------------------------
 _SIGNAL_RE = re.compile(r"<<<(STAY|MOVE_TO_EXPERIENCE|MOVE_TO_DONE)>>>")
 
+# Stray markdown formatting the model sometimes adds
+_TAYLOR_PREFIX_RE = re.compile(r"^(?:\*\*Taylor:\*\*|Taylor:)\s*")
+
+# Sentence boundary for streaming flushes: ., ? or ! (optionally followed by
+# a closing quote/bracket) at a whitespace break or end of buffer.
+_SENTENCE_END_RE = re.compile(r"[.?!][\"')\]]*(?:\s+|$)")
+
+# Force a flush if this many whitespace tokens pile up with no boundary
+# (long lists, bullet feedback, etc.) so TTS never starves.
+_PENDING_FLUSH_TOKENS = 80
+
+
+def _is_sentence_boundary(text: str) -> bool:
+    return bool(_SENTENCE_END_RE.search(text))
+
+
+def _take_sentences(pend: str, *, final: bool = False) -> tuple:
+    """Split pending streamed text into (flushable, remainder).
+
+    Flushes up to the last sentence boundary, or the whole safe region once
+    the pending buffer exceeds _PENDING_FLUSH_TOKENS tokens. Anything at or
+    after a (possibly partial) <<<SIGNAL>>> marker is always held back so
+    signals never reach TTS mid-stream.
+    """
+    cut = pend.find("<<<")
+    if cut != -1:
+        safe, held = pend[:cut], pend[cut:]
+    else:
+        safe, held = pend, ""
+
+    if final:
+        return safe, held
+
+    last = None
+    for m in _SENTENCE_END_RE.finditer(safe):
+        last = m
+    if last is not None:
+        return safe[: last.end()], safe[last.end():] + held
+    if len(safe.split()) >= _PENDING_FLUSH_TOKENS:
+        return safe, held
+    return "", pend
+
 
 def _parse(raw: str) -> tuple:
     m = _SIGNAL_RE.search(raw)
-    signal = m.group(1) if m else "STAY"
-    clean = _SIGNAL_RE.sub("", raw).strip()
-    # Remove stray markdown formatting the model sometimes adds
-    clean = re.sub(r"^\*\*Taylor:\*\*\s*", "", clean)
-    clean = re.sub(r"^Taylor:\s*", "", clean)
-    return clean, signal
+    if m is None:
+        clean = raw.strip()
+        signal = "STAY"
+    else:
+        signal = m.group(1)
+        # Splice out the (almost always unique) signal without a second scan
+        clean = raw[:m.start()] + raw[m.end():]
+        if "<<<" in clean:
+            clean = _SIGNAL_RE.sub("", clean)
+        clean = clean.strip()
+    return _TAYLOR_PREFIX_RE.sub("", clean), signal
 
 
 def _count(history: list, role: str, stage: str) -> int:
     return sum(1 for m in history if m.get("role") == role and m.get("stage") == stage)
 
 
-def _build_contents(history: list) -> list:
-    """Convert DB history to Gemini alternating user/model content list."""
-    raw = []
+def _build_contents(history: list, summary: str = "") -> list:
+    """Convert DB history to Gemini alternating user/model content list.
+
+    Agent rows are persisted already stripped of signals/prefixes (see
+    migration 0003 + _finish_turn), so text is trusted verbatim here.
+    A non-empty summary (compacted older history) leads as user context.
+    """
+    # Merge consecutive same-role runs (Gemini strict alternation
+    # requirement) by collecting each run and joining once — repeated
+    # `+=` on the last entry is quadratic over long histories.
+    merged = []
+    current_role, parts = None, []
+    if summary:
+        current_role = "user"
+        parts.append(f"[Summary of the interview so far: {summary}]")
     for msg in history:
         r = msg.get("role", "system")
         text = (msg.get("text") or "").strip()
         if not text or r == "system":
             continue
         gemini_role = "model" if r == "agent" else "user"
-        # Strip leftover signals from model text
-        if gemini_role == "model":
-            text = _SIGNAL_RE.sub("", text).strip()
-            text = re.sub(r"^\*\*Taylor:\*\*\s*", "", text)
-            text = re.sub(r"^Taylor:\s*", "", text)
-        if not text:
-            continue
-        raw.append({"role": gemini_role, "text": text})
-
-    # Merge consecutive same-role (Gemini strict alternation requirement)
-    merged = []
-    for m in raw:
-        if merged and merged[-1]["role"] == m["role"]:
-            merged[-1]["text"] += "\n" + m["text"]
-        else:
-            merged.append(dict(m))
-
-    # Convert to Gemini content format
-    contents = []
-    for m in merged:
-        contents.append(
-            types.Content(
-                role=m["role"],
-                parts=[types.Part.from_text(text=m["text"])],
-            )
+        if gemini_role != current_role:
+            if parts:
+                merged.append({"role": current_role, "text": "\n".join(parts)})
+            current_role, parts = gemini_role, []
+        parts.append(text)
+    if parts:
+        merged.append({"role": current_role, "text": "\n".join(parts)})
+
+    return [
+        types.Content(
+            role=m["role"],
+            parts=[types.Part.from_text(text=m["text"])],
         )
+        for m in merged
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Per-session contents cache
+# ---------------------------------------------------------------------------
+# Re-materializing every prior types.Content from DB history is O(N) per
+# turn; cache the list per session and append the new user/model turns
+# instead. Insertion-ordered dict doubles as an LRU-ish bound.
+_CONTENTS_CACHE: Dict[str, List[types.Content]] = {}
+_CONTENTS_CACHE_MAX = 256
+
+
+def _update_contents_cache(session_id: str, contents: List[types.Content], reply: str, done: bool) -> None:
+    if done:
+        _CONTENTS_CACHE.pop(session_id, None)
+        return
+    cached = list(contents)
+    cached.append(
+        types.Content(role="model", parts=[types.Part.from_text(text=reply)])
+    )
+    _CONTENTS_CACHE.pop(session_id, None)
+    _CONTENTS_CACHE[session_id] = cached
+    while len(_CONTENTS_CACHE) > _CONTENTS_CACHE_MAX:
+        _CONTENTS_CACHE.pop(next(iter(_CONTENTS_CACHE)))
 
-    return contents
+
+def invalidate_contents_cache(session_id: str) -> None:
+    """Drop the cached contents so the next turn rebuilds from DB history
+    (used after history compaction rewrites what the prompt should contain)."""
+    _CONTENTS_CACHE.pop(session_id, None)
 
 
 # ---------------------------------------------------------------------------
-# Main engine function
+# History compaction (summarize old turns so prefill stays bounded)
 # ---------------------------------------------------------------------------
-def run_engine(
+_SUMMARY_PROMPT = (
+    "You are compacting an interview transcript. Write a dense factual summary "
+    "(max 200 words) of the exchange below: candidate background, projects, "
+    "skills, and what has already been asked. No commentary, no formatting."
+)
+
+
+async def summarize_history_async(prev_summary: str, messages: List[Dict[str, Any]]) -> str:
+    """Summarize old turns (plus any previous summary) into a single block.
+    Runs on the cheap fallback model; returns "" on failure so callers can
+    simply skip compaction this round."""
+    lines = []
+    if prev_summary:
+        lines.append(f"[Earlier summary: {prev_summary}]")
+    for m in messages:
+        speaker = "Interviewer" if m.get("role") == "agent" else "Candidate"
+        lines.append(f"{speaker}: {m.get('text', '')}")
+    try:
+        resp = await _get_client().aio.models.generate_content(
+            model=FALLBACK_MODEL_NAME,
+            contents="\n".join(lines),
+            config=types.GenerateContentConfig(
+                system_instruction=_SUMMARY_PROMPT,
+                temperature=0.2,
+                max_output_tokens=400,
+            ),
+        )
+        return (resp.text or "").strip()
+    except Exception as e:
+        logger.warning(f"history summarization failed: {e!r}")
+        return ""
+
+
+# ---------------------------------------------------------------------------
+# Turn assembly / finalization (shared by sync and async paths)
+# ---------------------------------------------------------------------------
+_DONE_FINAL = {
+    "type": "final",
+    "assistant_text": "This session is already complete. Please create a new session.",
+    "next_stage": "done",
+    "done": True,
+}
+
+
+def _prepare_turn(
     *,
     session_id: str,
     candidate_name: str,
     role_name: str,
-    event_type: str,       # "start" | "user_turn" | "timeout"
+    event_type: str,
     user_text: str,
     history: List[Dict[str, Any]],
-    session_stage: str,     # "intro" | "experience" | "done"
-) -> Dict[str, Any]:
-    """
-    Single synchronous call: takes session state → calls Gemini → returns result.
-    Returns: {assistant_text: str, next_stage: str, done: bool}
-    """
+    session_stage: str,
+    summary: str = "",
+) -> tuple:
+    """Apply stage guard-rails and assemble the Gemini request.
+    Returns (stage, system_instruction, contents)."""
     stage = session_stage
 
-    # Already done
-    if stage == "done":
-        return {
-            "assistant_text": "This session is already complete. Please create a new session.",
-            "next_stage": "done",
-            "done": True,
-        }
-
     # Timeout → force transition
     if event_type == "timeout":
         if stage == "intro":
@@ -196,9 +319,10 @@ def run_engine(
     if stage == "experience" and exp_n >= MAX_EXP_TURNS:
         stage = "done"
 
-    # Build Gemini request
+    # Build Gemini request — reuse cached contents, rebuild on miss
     system = _system_prompt(candidate_name, role_name, stage)
-    contents = _build_contents(history)
+    cached = _CONTENTS_CACHE.get(session_id)
+    contents = list(cached) if cached is not None else _build_contents(history, summary)
 
     # Current user message
     if event_type == "start":
@@ -234,94 +358,415 @@ def run_engine(
             ),
         )
 
-    # Call Gemini with retry + backoff for rate limits
-    raw_text = ""
+    return stage, system, contents
+
+
+class _StreamBuffer:
+    """Accumulates streamed tokens and hands back sentence-bounded flushes."""
+
+    def __init__(self) -> None:
+        self.raw = ""
+        self._pend = ""
+        self._first = True
+
+    def feed(self, token: str) -> str:
+        """Add a token; return text ready to flush ("" if none yet)."""
+        if not token:
+            return ""
+        self.raw += token
+        self._pend += token
+        flush, self._pend = _take_sentences(self._pend)
+        return self._clean(flush)
+
+    def drain(self) -> str:
+        """Flush everything left before the signal marker (stream ended)."""
+        flush, self._pend = _take_sentences(self._pend, final=True)
+        return self._clean(flush)
+
+    def _clean(self, flush: str) -> str:
+        if flush and self._first:
+            # Strip stray markdown prefix before TTS hears it
+            flush = _TAYLOR_PREFIX_RE.sub("", flush)
+            self._first = False
+        return flush
+
+    @property
+    def streamed_any(self) -> bool:
+        return not self._first
+
+
+def _should_retry(err: Exception, attempt: int) -> bool:
+    err_str = str(err)
+    if "429" in err_str or "RESOURCE_EXHAUSTED" in err_str:
+        if attempt < MAX_RETRIES:
+            logger.warning(f"{MODEL_NAME} rate-limited, waiting {RETRY_WAIT}s (attempt {attempt+1}/{MAX_RETRIES+1})")
+            return True
+        logger.warning(f"{MODEL_NAME} rate-limited, out of retries")
+        return False
+    logger.error(f"{MODEL_NAME} error: {err_str[:200]}")
+    return False  # non-retryable error
+
+
+def _fallback_text(stage: str, history: list, candidate_name: str, role_name: str) -> str:
+    """Varied fallback responses — rotate based on turn count to avoid repetition."""
+    agent_count = _count(history, "agent", stage)
+    if stage == "intro":
+        intro_fallbacks = [
+            f"Hi {candidate_name}! Welcome — I'm excited to chat. Could you kick things off by telling me a bit about yourself? <<<STAY>>>",
+            f"Thanks for joining, {candidate_name}. What drew you to the {role_name} position? <<<STAY>>>",
+            f"That's great. What would you say is your strongest technical skill relevant to {role_name}? <<<STAY>>>",
+            f"Interesting background! What excites you most about this field? <<<STAY>>>",
+            f"Nice! Let's dive into your past experience now. <<<MOVE_TO_EXPERIENCE>>>",
+        ]
+        return intro_fallbacks[min(agent_count, len(intro_fallbacks) - 1)]
+    if stage == "experience":
+        exp_fallbacks = [
+            "I'd love to hear about a project you've worked on recently. What was the problem? <<<STAY>>>",
+            "Tell me more about the technical decisions you made in that project. <<<STAY>>>",
+            "What was the biggest challenge you faced, and how did you handle it? <<<STAY>>>",
+            "What impact did your work have? Any metrics you can share? <<<STAY>>>",
+            "That's really solid work. Let me wrap things up with some feedback. <<<MOVE_TO_DONE>>>",
+        ]
+        return exp_fallbacks[min(agent_count, len(exp_fallbacks) - 1)]
+    return (
+        "Thanks for a great conversation!\n\n"
+        "• Strength: You communicated your ideas clearly.\n"
+        "• Gap: Try to include more concrete metrics and impact.\n"
+        "• Next step: Practice the STAR method for telling project stories.\n\n"
+        "Best of luck — you've got this! <<<MOVE_TO_DONE>>>"
+    )
+
+
+def _finalize(raw_text: str, stage: str) -> tuple:
+    """Parse raw model output → (reply, signal, next_stage, done)."""
+    reply, signal = _parse(raw_text)
+
+    if not reply or len(reply) < 3:
+        reply = "Could you tell me more about that?" if stage == "experience" else "Please go on."
+
+    # Apply signal
+    next_stage = stage
+    done = False
+    if signal == "MOVE_TO_EXPERIENCE" and stage == "intro":
+        next_stage = "experience"
+    elif signal == "MOVE_TO_DONE":
+        next_stage = "done"
+        done = True
+
+    if stage == "done":
+        next_stage = "done"
+        done = True
+
+    return reply, signal, next_stage, done
+
+
+def _gen_config(system: str) -> types.GenerateContentConfig:
+    return types.GenerateContentConfig(
+        system_instruction=system,
+        temperature=TEMPERATURE,
+        max_output_tokens=MAX_TOKENS,
+    )
+
+
+async def _start_stream(model: str, contents, config):
+    """Open a streaming call and wait for its first chunk.
+    Returns (model, first_chunk_or_None, iterator)."""
+    stream = await _get_client().aio.models.generate_content_stream(
+        model=model, contents=contents, config=config
+    )
+    it = stream.__aiter__()
+    try:
+        first = await it.__anext__()
+    except StopAsyncIteration:
+        first = None
+    return model, first, it
+
+
+async def _open_hedged_stream(contents, config) -> tuple:
+    """Race the primary model against a delayed fallback hedge.
+
+    Fires the primary immediately; if no first token arrives within
+    HEDGE_DELAY_S (or the primary fails fast), fires FALLBACK_MODEL_NAME
+    too and continues with whichever streams first, cancelling the loser.
+    Bounds tail latency at hedge-delay + fast-model TTFT.
+    """
+    primary = asyncio.create_task(_start_stream(MODEL_NAME, contents, config))
+    done, _ = await asyncio.wait({primary}, timeout=HEDGE_DELAY_S)
+    if done and primary.exception() is None:
+        return primary.result()
+
+    hedgeable = bool(FALLBACK_MODEL_NAME) and FALLBACK_MODEL_NAME != MODEL_NAME
+    if not hedgeable:
+        return await primary  # re-raises on failure
+
+    if done:
+        # primary already failed — go straight to the fallback model
+        logger.warning(f"{MODEL_NAME} failed fast ({str(primary.exception())[:120]}); trying {FALLBACK_MODEL_NAME}")
+        return await _start_stream(FALLBACK_MODEL_NAME, contents, config)
+
+    logger.info(f"no first token from {MODEL_NAME} after {HEDGE_DELAY_S}s; hedging to {FALLBACK_MODEL_NAME}")
+    hedge = asyncio.create_task(_start_stream(FALLBACK_MODEL_NAME, contents, config))
+    pending = {primary, hedge}
+    winner = None
+    last_exc = None
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for t in done:
+            if t.exception() is None:
+                if winner is None:
+                    winner = t.result()
+            else:
+                last_exc = t.exception()
+        if winner is not None:
+            for t in pending:
+                t.cancel()
+            return winner
+    raise last_exc
+
+
+# ---------------------------------------------------------------------------
+# Main engine functions
+# ---------------------------------------------------------------------------
+def run_engine_stream(
+    *,
+    session_id: str,
+    candidate_name: str,
+    role_name: str,
+    event_type: str,       # "start" | "user_turn" | "timeout"
+    user_text: str,
+    history: List[Dict[str, Any]],
+    session_stage: str,     # "intro" | "experience" | "done"
+    summary: str = "",      # compacted older history, if any
+):
+    """
+    Streaming variant: takes session state → streams Gemini → yields events.
+
+    Yields {"type": "delta", "text": ...} for each sentence-bounded chunk as
+    Gemini produces it, then exactly one
+    {"type": "final", "assistant_text": ..., "next_stage": ..., "done": ...}.
+    Signal parsing is buffered until stream end so <<<SIGNAL>>> never leaks
+    into a delta.
+    """
+    # Already done
+    if session_stage == "done":
+        yield dict(_DONE_FINAL)
+        return
+
+    stage, system, contents = _prepare_turn(
+        session_id=session_id,
+        candidate_name=candidate_name,
+        role_name=role_name,
+        event_type=event_type,
+        user_text=user_text,
+        history=history,
+        session_stage=session_stage,
+        summary=summary,
+    )
+
+    # Call Gemini (streaming) with retry + backoff for rate limits
+    buf = _StreamBuffer()
     t0 = time.time()
     last_err = None
     client = _get_client()
 
-    MAX_RETRIES = 1
-    RETRY_WAIT = 8  # seconds — quick retry, then fallback
-
     for attempt in range(MAX_RETRIES + 1):
         try:
-            response = client.models.generate_content(
+            stream = client.models.generate_content_stream(
                 model=MODEL_NAME,
                 contents=contents,
-                config=types.GenerateContentConfig(
-                    system_instruction=system,
-                    temperature=TEMPERATURE,
-                    max_output_tokens=MAX_TOKENS,
-                ),
+                config=_gen_config(system),
             )
-            raw_text = response.text or ""
+            for chunk in stream:
+                flush = buf.feed(chunk.text or "")
+                if flush:
+                    yield {"type": "delta", "text": flush}
             elapsed = time.time() - t0
-            logger.info(f"OK {MODEL_NAME} in {elapsed:.2f}s | stage={stage} | len={len(raw_text)}")
+            logger.info(f"OK {MODEL_NAME} in {elapsed:.2f}s | stage={stage} | len={len(buf.raw)}")
             last_err = None
             break
         except Exception as e:
             last_err = e
-            err_str = str(e)
-            if "429" in err_str or "RESOURCE_EXHAUSTED" in err_str:
-                if attempt < MAX_RETRIES:
-                    logger.warning(f"{MODEL_NAME} rate-limited, waiting {RETRY_WAIT}s (attempt {attempt+1}/{MAX_RETRIES+1})")
-                    time.sleep(RETRY_WAIT)
-                else:
-                    logger.warning(f"{MODEL_NAME} rate-limited, out of retries")
-            else:
-                logger.error(f"{MODEL_NAME} error: {err_str[:200]}")
-                break  # non-retryable error
+            if buf.raw:
+                # Tokens already streamed out — finish with what we have
+                logger.error(f"{MODEL_NAME} mid-stream error: {str(e)[:200]}")
+                last_err = None
+                break
+            if not _should_retry(e, attempt):
+                break
+            time.sleep(RETRY_WAIT)
+
+    # Flush whatever is left before the signal marker
+    tail = buf.drain()
+    if tail.strip():
+        yield {"type": "delta", "text": tail}
+
+    raw_text = buf.raw
+    if last_err:
+        logger.error(f"Gemini FAILED in {time.time() - t0:.2f}s (all retries exhausted)")
+        raw_text = _fallback_text(stage, history, candidate_name, role_name)
+
+    reply, signal, next_stage, done = _finalize(raw_text, stage)
+
+    _update_contents_cache(session_id, contents, reply, done)
 
+    # Fallback / substitute replies never went through the token stream
+    if not buf.streamed_any and reply:
+        yield {"type": "delta", "text": reply}
+
+    yield {"type": "final", "assistant_text": reply, "signal": signal, "next_stage": next_stage, "done": done}
+
+
+async def run_engine_stream_async(
+    *,
+    session_id: str,
+    candidate_name: str,
+    role_name: str,
+    event_type: str,       # "start" | "user_turn" | "timeout"
+    user_text: str,
+    history: List[Dict[str, Any]],
+    session_stage: str,     # "intro" | "experience" | "done"
+    summary: str = "",      # compacted older history, if any
+):
+    """
+    Async twin of run_engine_stream using client.aio — the event loop stays
+    free to serve other sessions during the Gemini roundtrip. Same event
+    protocol: delta events, then one final event.
+    """
+    # Already done
+    if session_stage == "done":
+        yield dict(_DONE_FINAL)
+        return
+
+    stage, system, contents = _prepare_turn(
+        session_id=session_id,
+        candidate_name=candidate_name,
+        role_name=role_name,
+        event_type=event_type,
+        user_text=user_text,
+        history=history,
+        session_stage=session_stage,
+        summary=summary,
+    )
+
+    # Call Gemini (streaming) with retry + backoff for rate limits
+    buf = _StreamBuffer()
+    t0 = time.time()
+    last_err = None
+
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            model_used, chunk, stream_it = await _open_hedged_stream(contents, _gen_config(system))
+            while chunk is not None:
+                flush = buf.feed(chunk.text or "")
+                if flush:
+                    yield {"type": "delta", "text": flush}
+                try:
+                    chunk = await stream_it.__anext__()
+                except StopAsyncIteration:
+                    chunk = None
+            elapsed = time.time() - t0
+            logger.info(f"OK {model_used} in {elapsed:.2f}s | stage={stage} | len={len(buf.raw)}")
+            last_err = None
+            break
+        except Exception as e:
+            last_err = e
+            if buf.raw:
+                # Tokens already streamed out — finish with what we have
+                logger.error(f"{MODEL_NAME} mid-stream error: {str(e)[:200]}")
+                last_err = None
+                break
+            if not _should_retry(e, attempt):
+                break
+            await asyncio.sleep(RETRY_WAIT)
+
+    # Flush whatever is left before the signal marker
+    tail = buf.drain()
+    if tail.strip():
+        yield {"type": "delta", "text": tail}
+
+    raw_text = buf.raw
     if last_err:
-        elapsed = time.time() - t0
-        logger.error(f"Gemini FAILED in {elapsed:.2f}s (all retries exhausted)")
+        logger.error(f"Gemini FAILED in {time.time() - t0:.2f}s (all retries exhausted)")
+        raw_text = _fallback_text(stage, history, candidate_name, role_name)
 
-        # Varied fallback responses — rotate based on turn count to avoid repetition
-        agent_count = _count(history, "agent", stage)
-        if stage == "intro":
-            intro_fallbacks = [
-                f"Hi {candidate_name}! Welcome — I'm excited to chat. Could you kick things off by telling me a bit about yourself? <<<STAY>>>",
-                f"Thanks for joining, {candidate_name}. What drew you to the {role_name} position? <<<STAY>>>",
-                f"That's great. What would you say is your strongest technical skill relevant to {role_name}? <<<STAY>>>",
-                f"Interesting background! What excites you most about this field? <<<STAY>>>",
-                f"Nice! Let's dive into your past experience now. <<<MOVE_TO_EXPERIENCE>>>",
-            ]
-            raw_text = intro_fallbacks[min(agent_count, len(intro_fallbacks) - 1)]
-        elif stage == "experience":
-            exp_fallbacks = [
-                "I'd love to hear about a project you've worked on recently. What was the problem? <<<STAY>>>",
-                "Tell me more about the technical decisions you made in that project. <<<STAY>>>",
-                "What was the biggest challenge you faced, and how did you handle it? <<<STAY>>>",
-                "What impact did your work have? Any metrics you can share? <<<STAY>>>",
-                "That's really solid work. Let me wrap things up with some feedback. <<<MOVE_TO_DONE>>>",
-            ]
-            raw_text = exp_fallbacks[min(agent_count, len(exp_fallbacks) - 1)]
-        else:
-            raw_text = (
-                "Thanks for a great conversation!\n\n"
-                "• Strength: You communicated your ideas clearly.\n"
-                "• Gap: Try to include more concrete metrics and impact.\n"
-                "• Next step: Practice the STAR method for telling project stories.\n\n"
-                "Best of luck — you've got this! <<<MOVE_TO_DONE>>>"
-            )
+    reply, signal, next_stage, done = _finalize(raw_text, stage)
 
-    # Parse
-    reply, signal = _parse(raw_text)
+    _update_contents_cache(session_id, contents, reply, done)
 
-    if not reply or len(reply) < 3:
-        reply = "Could you tell me more about that?" if stage == "experience" else "Please go on."
+    # Fallback / substitute replies never went through the token stream
+    if not buf.streamed_any and reply:
+        yield {"type": "delta", "text": reply}
 
-    # Apply signal
-    next_stage = stage
-    done = False
-    if signal == "MOVE_TO_EXPERIENCE" and stage == "intro":
-        next_stage = "experience"
-    elif signal == "MOVE_TO_DONE":
-        next_stage = "done"
-        done = True
+    yield {"type": "final", "assistant_text": reply, "signal": signal, "next_stage": next_stage, "done": done}
 
-    if stage == "done":
-        next_stage = "done"
-        done = True
 
-    return {"assistant_text": reply, "next_stage": next_stage, "done": done}
\ No newline at end of file
+def run_engine(
+    *,
+    session_id: str,
+    candidate_name: str,
+    role_name: str,
+    event_type: str,       # "start" | "user_turn" | "timeout"
+    user_text: str,
+    history: List[Dict[str, Any]],
+    session_stage: str,     # "intro" | "experience" | "done"
+    summary: str = "",      # compacted older history, if any
+) -> Dict[str, Any]:
+    """
+    Single synchronous call: drains run_engine_stream → returns the final result.
+    Returns: {assistant_text: str, next_stage: str, done: bool}
+    """
+    out: Dict[str, Any] = {}
+    for event in run_engine_stream(
+        session_id=session_id,
+        candidate_name=candidate_name,
+        role_name=role_name,
+        event_type=event_type,
+        user_text=user_text,
+        history=history,
+        session_stage=session_stage,
+        summary=summary,
+    ):
+        if event["type"] == "final":
+            out = event
+    return {
+        "assistant_text": out.get("assistant_text", ""),
+        "signal": out.get("signal", "STAY"),
+        "next_stage": out.get("next_stage", session_stage),
+        "done": bool(out.get("done")),
+    }
+
+
+async def run_engine_async(
+    *,
+    session_id: str,
+    candidate_name: str,
+    role_name: str,
+    event_type: str,       # "start" | "user_turn" | "timeout"
+    user_text: str,
+    history: List[Dict[str, Any]],
+    session_stage: str,     # "intro" | "experience" | "done"
+    summary: str = "",      # compacted older history, if any
+) -> Dict[str, Any]:
+    """
+    Single async call: drains run_engine_stream_async → returns the final result.
+    Returns: {assistant_text: str, next_stage: str, done: bool}
+    """
+    out: Dict[str, Any] = {}
+    async for event in run_engine_stream_async(
+        session_id=session_id,
+        candidate_name=candidate_name,
+        role_name=role_name,
+        event_type=event_type,
+        user_text=user_text,
+        history=history,
+        session_stage=session_stage,
+        summary=summary,
+    ):
+        if event["type"] == "final":
+            out = event
+    return {
+        "assistant_text": out.get("assistant_text", ""),
+        "signal": out.get("signal", "STAY"),
+        "next_stage": out.get("next_stage", session_stage),
+        "done": bool(out.get("done")),
+    }
\ No newline at end of file
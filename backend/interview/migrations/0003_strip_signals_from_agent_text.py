@@ -0,0 +1,32 @@
+import re
+
+from django.db import migrations
+
+_SIGNAL_RE = re.compile(r"<<<(STAY|MOVE_TO_EXPERIENCE|MOVE_TO_DONE)>>>")
+_TAYLOR_PREFIX_RE = re.compile(r"^(?:\*\*Taylor:\*\*|Taylor:)\s*")
+
+
+def strip_agent_text(apps, schema_editor):
+    """Agent messages are now stored already clean; strip legacy rows once
+    so _build_contents can trust text verbatim."""
+    InterviewMessage = apps.get_model("interview", "InterviewMessage")
+    for msg in InterviewMessage.objects.filter(role="agent").iterator():
+        m = _SIGNAL_RE.search(msg.text)
+        clean = _SIGNAL_RE.sub("", msg.text).strip()
+        clean = _TAYLOR_PREFIX_RE.sub("", clean)
+        if clean != msg.text:
+            msg.text = clean
+            if m and "signal" not in (msg.meta or {}):
+                msg.meta = {**(msg.meta or {}), "signal": m.group(1)}
+            msg.save(update_fields=["text", "meta"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("interview", "0002_interviewsession_last_turn_at_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(strip_agent_text, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-29 13:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0003_strip_signals_from_agent_text'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='interviewmessage',
+            index=models.Index(fields=['session', 'role', 'stage'], name='im_sess_role_stage_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-29 14:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0004_interviewmessage_role_stage_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interviewsession',
+            name='summary',
+            field=models.TextField(blank=True, default=''),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.17 on 2026-08-29 14:17
+
+import interview.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0005_interviewsession_summary'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='interviewmessage',
+            name='id',
+            field=models.UUIDField(default=interview.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='interviewsession',
+            name='id',
+            field=models.UUIDField(default=interview.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
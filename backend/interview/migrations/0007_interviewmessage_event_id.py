@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-29 14:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0006_alter_interviewmessage_id_alter_interviewsession_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interviewmessage',
+            name='event_id',
+            field=models.CharField(blank=True, max_length=64, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,27 @@
+from django.db import migrations
+
+
+def backfill_event_id(apps, schema_editor):
+    """Copy meta.event_id into the new column for agent rows so old turns
+    stay replayable through the indexed probe. Agent rows only — the paired
+    user row shares the id and would trip the unique constraint."""
+    InterviewMessage = apps.get_model("interview", "InterviewMessage")
+    seen = set()
+    for msg in InterviewMessage.objects.filter(role="agent", event_id__isnull=True).iterator():
+        eid = (msg.meta or {}).get("event_id")
+        if not eid or eid in seen:
+            continue
+        seen.add(eid)
+        msg.event_id = eid
+        msg.save(update_fields=["event_id"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("interview", "0007_interviewmessage_event_id"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_event_id, migrations.RunPython.noop),
+    ]
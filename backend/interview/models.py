@@ -1,7 +1,26 @@
+import os
+import time
 import uuid
 from django.db import models
 
 
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUIDv7 (RFC 9562 layout): 48-bit unix-ms timestamp then
+    random bits. New rows land on the right edge of the PK B-tree instead of
+    splitting random pages like v4. Local helper — stdlib has no uuid7 yet."""
+    ts_ms = time.time_ns() // 1_000_000
+    rand_a = int.from_bytes(os.urandom(2), "big") & 0x0FFF
+    rand_b = int.from_bytes(os.urandom(8), "big") & 0x3FFFFFFFFFFFFFFF
+    value = (
+        (ts_ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | rand_a << 64
+        | 0x2 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
+
+
 class InterviewSession(models.Model):
     class Status(models.TextChoices):
         CREATED = "created", "Created"
@@ -14,7 +33,7 @@ class InterviewSession(models.Model):
         EXPERIENCE = "experience", "Experience"
         DONE = "done", "Done"
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
 
     # LiveKit room for this interview
     room_name = models.CharField(max_length=128, unique=True)
@@ -25,6 +44,10 @@ class InterviewSession(models.Model):
     status = models.CharField(max_length=32, choices=Status.choices, default=Status.CREATED)
     stage = models.CharField(max_length=32, choices=Stage.choices, default=Stage.INTRO)
 
+    # Compacted summary of older turns — replaces messages whose meta has
+    # superseded=True when the engine builds the Gemini prompt
+    summary = models.TextField(blank=True, default="")
+
     # --- Phase 2 timing fields for fallback ---
     stage_started_at = models.DateTimeField(null=True, blank=True)
     last_turn_at = models.DateTimeField(null=True, blank=True)
@@ -43,7 +66,7 @@ class InterviewMessage(models.Model):
         AGENT = "agent", "Agent"
         SYSTEM = "system", "System"
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     session = models.ForeignKey(InterviewSession, on_delete=models.CASCADE, related_name="messages")
 
     role = models.CharField(max_length=16, choices=Role.choices)
@@ -55,9 +78,16 @@ class InterviewMessage(models.Model):
 
     meta = models.JSONField(default=dict, blank=True)
 
+    # idempotency key of the turn that produced this reply — set on agent
+    # rows only, so the unique index doubles as the retry-replay probe
+    # (a JSON meta__event_id predicate can't use a plain B-tree)
+    event_id = models.CharField(max_length=64, null=True, blank=True, unique=True)
+
     class Meta:
         indexes = [
             models.Index(fields=["session", "created_at"]),
+            # covers the guard-rail count path: role/stage filters per session
+            models.Index(fields=["session", "role", "stage"], name="im_sess_role_stage_idx"),
         ]
 
     def __str__(self):
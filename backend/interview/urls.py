@@ -13,5 +13,6 @@ urlpatterns = [
 
     # UI-only (Phase 3): works in browser without exposing secret (DEBUG-only)
     path("api/interview/ui/next_turn/", views.ui_next_turn, name="ui_next_turn"),
+    path("api/interview/turn_result/<str:task_id>/", views.turn_result, name="turn_result"),
     path("api/interview/livekit/token/", views.livekit_token, name="livekit_token"),
 ]
\ No newline at end of file
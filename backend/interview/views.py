@@ -1,7 +1,15 @@
-import json
+import asyncio
+import logging
+import threading
+import time
 import uuid
+
+import orjson
+from asgiref.sync import sync_to_async
 from django.conf import settings
-from django.http import JsonResponse, HttpResponse, HttpResponseForbidden
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse, HttpResponseForbidden, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.template import loader
@@ -9,36 +17,65 @@ from django.template import TemplateDoesNotExist
 from django.utils import timezone
 
 from .models import InterviewSession, InterviewMessage
-from .engine import run_engine
+from .engine import (
+    invalidate_contents_cache,
+    run_engine_async,
+    run_engine_stream_async,
+    summarize_history_async,
+)
 from livekit.api import AccessToken, VideoGrants
 from livekit.api import RoomAgentDispatch, RoomConfiguration
 
+logger = logging.getLogger("interview.views")
+
+class ORJsonResponse(HttpResponse):
+    """JsonResponse on orjson — skips DjangoJSONEncoder on the hot turn path.
+    orjson natively handles UUID/datetime and returns bytes."""
+
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(content=orjson.dumps(data), **kwargs)
+
+
+# Liveness probes hit this every second per instance — serve precomputed
+# bytes, no dict/dumps/response construction per hit
+_HEALTH_BODY = orjson.dumps({"ok": True})
+
+
 def health(request):
-    return JsonResponse({"ok": True})
+    return HttpResponse(_HEALTH_BODY, content_type="application/json")
+
+
+# Resolved once at import: the demo page either ships with the build or it
+# doesn't — no point re-raising TemplateDoesNotExist per request
+try:
+    _DEMO_TEMPLATE = loader.get_template("interview/demo.html")
+except TemplateDoesNotExist:
+    _DEMO_TEMPLATE = None
+
+
+_DEMO_FALLBACK_BODY = (
+    b"Demo UI not added yet. API ready:\n"
+    b"- POST /api/interview/sessions/create/\n"
+    b"- POST /api/interview/engine/next_turn/   (requires X-INGEST-SECRET)\n"
+    b"- POST /api/interview/ui/next_turn/       (DEBUG-only, for browser UI)\n"
+    b"- GET  /api/interview/sessions/<id>/messages/\n"
+)
 
 
 def demo(request):
-    try:
-        template = loader.get_template("interview/demo.html")
-        return HttpResponse(template.render({}, request))
-    except TemplateDoesNotExist:
-        return HttpResponse(
-            "Demo UI not added yet. API ready:\n"
-            "- POST /api/interview/sessions/create/\n"
-            "- POST /api/interview/engine/next_turn/   (requires X-INGEST-SECRET)\n"
-            "- POST /api/interview/ui/next_turn/       (DEBUG-only, for browser UI)\n"
-            "- GET  /api/interview/sessions/<id>/messages/\n",
-            content_type="text/plain",
-        )
+    if _DEMO_TEMPLATE is not None:
+        return HttpResponse(_DEMO_TEMPLATE.render({}, request))
+    return HttpResponse(_DEMO_FALLBACK_BODY, content_type="text/plain")
 
 
 @csrf_exempt
 @require_http_methods(["POST"])
-def create_session(request):
+async def create_session(request):
     try:
-        payload = json.loads(request.body.decode("utf-8") or "{}")
-    except json.JSONDecodeError:
-        return JsonResponse({"error": "Invalid JSON"}, status=400)
+        payload = orjson.loads(request.body or b"{}")
+    except orjson.JSONDecodeError:
+        return ORJsonResponse({"error": "Invalid JSON"}, status=400)
 
     candidate_name = (payload.get("candidate_name") or "Candidate").strip()
     role = (payload.get("role") or "AI Algorithm Engineer Intern").strip()
@@ -46,7 +83,7 @@ def create_session(request):
 
     now = timezone.now()
 
-    session = InterviewSession.objects.create(
+    session = await InterviewSession.objects.acreate(
         room_name=room_name,
         candidate_name=candidate_name,
         role=role,
@@ -56,7 +93,7 @@ def create_session(request):
         last_turn_at=now,
     )
 
-    InterviewMessage.objects.create(
+    await InterviewMessage.objects.acreate(
         session=session,
         role=InterviewMessage.Role.SYSTEM,
         stage=session.stage,
@@ -65,7 +102,7 @@ def create_session(request):
         meta={},
     )
 
-    return JsonResponse(
+    return ORJsonResponse(
         {
             "session_id": str(session.id),
             "room_name": session.room_name,
@@ -79,19 +116,32 @@ def create_session(request):
 
 
 @require_http_methods(["GET"])
-def list_messages(request, session_id):
+async def list_messages(request, session_id):
     try:
-        session = InterviewSession.objects.get(id=session_id)
+        session = await InterviewSession.objects.aget(id=session_id)
     except InterviewSession.DoesNotExist:
-        return JsonResponse({"error": "Unknown session_id"}, status=404)
+        return ORJsonResponse({"error": "Unknown session_id"}, status=404)
 
-    msgs = (
-        session.messages
-        .order_by("created_at")
-        .values("created_at", "role", "stage", "text", "is_final", "meta")
-    )
+    # optional windowing for long transcripts: ?limit=N returns the last N
+    # messages (still chronological) via an indexed top-N scan
+    try:
+        limit = min(max(int(request.GET.get("limit", 0)), 0), 500)
+    except ValueError:
+        limit = 0
+
+    qs = session.messages.values("created_at", "role", "stage", "text", "is_final", "meta")
+    if limit:
+        msgs = [m async for m in qs.order_by("-created_at")[:limit]]
+        msgs.reverse()
+    else:
+        msgs = [
+            m async for m in (
+                qs.order_by("created_at")
+                .aiterator(chunk_size=200)  # long sessions: stream, don't materialize twice
+            )
+        ]
 
-    return JsonResponse(
+    return ORJsonResponse(
         {
             "session_id": str(session.id),
             "status": session.status,
@@ -103,11 +153,187 @@ def list_messages(request, session_id):
     )
 
 
-def _handle_next_turn(request, *, require_secret: bool):
+# Idempotency cache: LiveKit retries re-send the same event_id; serve the
+# finished turn from cache instead of re-running Gemini. Keyed per session so
+# one session can never replay another's turn. Goes through Django's cache —
+# LocMem per process by default, one Redis round-trip shared across workers
+# when REDIS_URL points CACHES at Redis.
+_EVENT_CACHE_TTL = 600  # seconds
+
+
+def _event_cache_key(session_id, event_id: str) -> str:
+    return f"evt-resp:{session_id}:{event_id}"
+
+
+# Non-realtime turn offload: long-tail Gemini turns can run detached from
+# the client connection — the view returns 202 + task_id immediately and the
+# caller polls turn_result. Tasks live in-process (a bounded asyncio task
+# table) since this deployment has no Celery/Redis broker.
+_TURN_TASKS: dict = {}
+_TURN_TASK_TTL = 300.0  # seconds a finished result stays pollable
+_TURN_TASK_MAX = 1_000
+_turn_task_lock = threading.Lock()
+
+
+def _turn_task_put(task_id: str, task) -> None:
+    with _turn_task_lock:
+        now = time.monotonic()
+        for k in [k for k, (ts, t) in _TURN_TASKS.items() if t.done() and now - ts > _TURN_TASK_TTL]:
+            del _TURN_TASKS[k]
+        _TURN_TASKS[task_id] = (now, task)
+        while len(_TURN_TASKS) > _TURN_TASK_MAX:
+            _TURN_TASKS.pop(next(iter(_TURN_TASKS)))
+
+
+@require_http_methods(["GET"])
+async def turn_result(request, task_id):
+    with _turn_task_lock:
+        hit = _TURN_TASKS.get(task_id)
+    if hit is None:
+        return ORJsonResponse({"error": "Unknown task_id"}, status=404)
+    _, task = hit
+    if not task.done():
+        return ORJsonResponse({"status": "pending"}, status=202)
+    try:
+        result = task.result()
+    except Exception as e:
+        return ORJsonResponse({"status": "error", "detail": str(e)}, status=500)
+    return ORJsonResponse({"status": "done", **result})
+
+
+# Background history compaction: once a session's live transcript outgrows
+# HISTORY_SUMMARY_CHARS, fold everything but the most recent turns into
+# session.summary so Gemini prefill stays bounded. Fire-and-forget — keep a
+# reference so the task isn't garbage-collected mid-flight.
+_compaction_tasks: set = set()
+
+
+def _schedule_compaction(session_id) -> None:
+    task = asyncio.ensure_future(_maybe_compact_history(session_id))
+    _compaction_tasks.add(task)
+    task.add_done_callback(_compaction_tasks.discard)
+
+
+async def _maybe_compact_history(session_id) -> None:
+    try:
+        session = await InterviewSession.objects.aget(id=session_id)
+        msgs = [
+            m async for m in (
+                InterviewMessage.objects
+                .filter(session=session)
+                .exclude(role=InterviewMessage.Role.SYSTEM)
+                .exclude(meta__has_key="superseded")
+                .order_by("created_at")
+            )
+        ]
+        total_chars = sum(len(m.text) for m in msgs)
+        if total_chars <= settings.HISTORY_SUMMARY_CHARS or len(msgs) <= settings.HISTORY_KEEP_RECENT:
+            return
+
+        old = msgs[: -settings.HISTORY_KEEP_RECENT]
+        summary = await summarize_history_async(
+            session.summary or "",
+            [{"role": m.role, "text": m.text} for m in old],
+        )
+        if not summary:
+            return
+
+        session.summary = summary
+        await session.asave(update_fields=["summary", "updated_at"])
+        for m in old:
+            m.meta["superseded"] = True
+        await InterviewMessage.objects.abulk_update(old, ["meta"])
+        # next turn must rebuild contents as [summary] + recent turns
+        invalidate_contents_cache(str(session.id))
+        logger.info("compacted %d msgs (%d chars) for session %s", len(old), total_chars, session.id)
+    except Exception:
+        logger.exception("history compaction failed for session %s", session_id)
+
+
+async def _finish_turn(session, *, event_type, user_text, event_id, engine_event_type, out, now):
+    """Persist the user + agent rows and session stage/status after the
+    engine ran — one bulk insert, off the reply critical path."""
+    assistant_text = out["assistant_text"]
+    next_stage = out["next_stage"]
+    done = bool(out["done"])
+
+    rows = []
+    # user msg (exactly one row per user answer), stamped with pre-turn stage
+    if event_type == "user_turn" and user_text:
+        rows.append(InterviewMessage(
+            session=session,
+            role=InterviewMessage.Role.USER,
+            stage=session.stage,
+            text=user_text,
+            is_final=True,
+            meta={"event_id": event_id} if event_id else {},
+        ))
+
+    # agent msg — text arrives already signal/prefix-stripped; keep the
+    # raw signal in meta for debugging
+    meta = {"engine_event_type": engine_event_type, "signal": out.get("signal", "STAY")}
+    if event_id:
+        meta["event_id"] = event_id
+    rows.append(InterviewMessage(
+        session=session,
+        role=InterviewMessage.Role.AGENT,
+        stage=next_stage,
+        text=assistant_text,
+        is_final=True,
+        meta=meta,
+        event_id=event_id or None,  # unique-indexed retry-probe key
+    ))
+    # update stage timing if stage changed
+    stage_changed = (next_stage != session.stage)
+    session.stage = next_stage
+    if stage_changed:
+        session.stage_started_at = now
+    if event_type == "user_turn":
+        session.last_turn_at = now
+
+    if done:
+        session.status = InterviewSession.Status.ENDED
+        session.ended_at = now
+
+    # One transaction for the whole write phase: the session row is locked
+    # first so two in-flight turns for the same session commit serially
+    # instead of interleaving stage transitions. Runs in a worker thread —
+    # the async ORM can't hold a transaction open across awaits. The lock
+    # only spans these two statements, never the Gemini call. (No-op lock on
+    # sqlite; real FOR UPDATE on Postgres.)
+    def _commit():
+        with transaction.atomic():
+            InterviewSession.objects.select_for_update().only("id").get(pk=session.pk)
+            # race-safe dedup: if a concurrent retry beat us past the
+            # pre-engine probes, its rows are already committed — skip ours
+            # (indexed event_id check, held under the session lock)
+            if event_id and InterviewMessage.objects.filter(event_id=event_id).exists():
+                return
+            # ignore_conflicts compiles to ON CONFLICT DO NOTHING on
+            # Postgres: the unique event_id index deduplicates atomically in
+            # the insert itself if anything slips past the check above
+            InterviewMessage.objects.bulk_create(rows, ignore_conflicts=True)
+            # status/ended_at ride along unconditionally: the created→running
+            # flip staged in _handle_next_turn lands here, not a second UPDATE
+            session.save(update_fields=["stage", "stage_started_at", "last_turn_at", "status", "ended_at", "updated_at"])
+
+    await sync_to_async(_commit)()
+
+    if event_id:
+        await cache.aset(
+            _event_cache_key(session.id, event_id),
+            {"assistant_text": assistant_text, "stage": next_stage, "done": done},
+            timeout=_EVENT_CACHE_TTL,
+        )
+
+    return assistant_text, next_stage, done
+
+
+async def _handle_next_turn(request, *, require_secret: bool, stream: bool = False):
     """
     Shared handler for:
-      - next_turn (protected, for LiveKit Builder)
-      - ui_next_turn (DEBUG-only, for browser UI)
+      - next_turn (protected, for LiveKit Builder) — streams NDJSON chunks
+      - ui_next_turn (DEBUG-only, for browser UI) — buffered JSON
     """
     if require_secret:
         if request.headers.get("X-INGEST-SECRET", "") != (settings.INGEST_SECRET or ""):
@@ -118,65 +344,77 @@ def _handle_next_turn(request, *, require_secret: bool):
             return HttpResponseForbidden("UI endpoint disabled when DEBUG=False")
 
     try:
-        payload = json.loads(request.body.decode("utf-8") or "{}")
-    except json.JSONDecodeError:
-        return JsonResponse({"error": "Invalid JSON"}, status=400)
+        payload = orjson.loads(request.body or b"{}")
+    except orjson.JSONDecodeError:
+        return ORJsonResponse({"error": "Invalid JSON"}, status=400)
 
     session_id = payload.get("session_id")
     event_type = (payload.get("event_type") or "user_turn").strip()  # start|user_turn
     user_text = (payload.get("user_text") or "").strip()
     event_id = (payload.get("event_id") or "").strip()
 
+    # the browser UI can opt into the same NDJSON stream the agent consumes
+    stream = stream or bool(payload.get("stream"))
+    # ...or detach entirely: 202 + task_id now, result via GET /turn_result/
+    background = bool(payload.get("background")) and not stream
+
     if not session_id:
-        return JsonResponse({"error": "session_id is required"}, status=400)
+        return ORJsonResponse({"error": "session_id is required"}, status=400)
 
     try:
-        session = InterviewSession.objects.get(id=session_id)
+        session = await InterviewSession.objects.aget(id=session_id)
     except InterviewSession.DoesNotExist:
-        return JsonResponse({"error": "Unknown session_id"}, status=404)
+        return ORJsonResponse({"error": "Unknown session_id"}, status=404)
 
     now = timezone.now()
 
-    # mark running on first interaction
+    # mark running on first interaction — staged in memory only; _finish_turn
+    # writes it with the end-of-turn save, so a turn costs one session UPDATE
     if session.status == InterviewSession.Status.CREATED:
         session.status = InterviewSession.Status.RUNNING
         session.last_turn_at = now
         if not session.stage_started_at:
             session.stage_started_at = now
-        session.save(update_fields=["status", "last_turn_at", "stage_started_at", "updated_at"])
 
-    # idempotency
+    # idempotency — in-memory first (no DB hit on hot retries), then one
+    # unique-index probe on the dedicated event_id column: the agent row
+    # carrying the key IS the reply to replay
     if event_id:
-        exists = InterviewMessage.objects.filter(session=session, meta__event_id=event_id).exists()
-        if exists:
-            last_agent = (
-                InterviewMessage.objects
-                .filter(session=session, role=InterviewMessage.Role.AGENT)
-                .order_by("-created_at")
-                .first()
-            )
-            return JsonResponse({
-                "assistant_text": last_agent.text if last_agent else "",
+        cached = await cache.aget(_event_cache_key(session.id, event_id))
+        if cached is not None:
+            return ORJsonResponse(cached)
+        dup = (
+            await InterviewMessage.objects
+            .filter(session=session, event_id=event_id)
+            .values("text")
+            .afirst()
+        )
+        if dup is not None:
+            return ORJsonResponse({
+                "assistant_text": dup["text"],
                 "stage": session.stage,
                 "done": session.stage == "done",
             })
 
+    # load recent history — narrow columns only (no meta JSON decode), capped
+    # to the last N rows since Gemini gains nothing from unbounded context;
+    # rows already folded into session.summary are skipped
+    history = [
+        m async for m in (
+            session.messages
+            .exclude(meta__has_key="superseded")
+            .order_by("-created_at")
+            .values("role", "stage", "text")[: settings.HISTORY_MAX_MESSAGES]
+        )
+    ]
+    history.reverse()  # back to chronological
+
     # validate user_turn text
     if event_type == "user_turn" and not user_text:
-        return JsonResponse({"error": "user_text required for event_type=user_turn"}, status=400)
+        return ORJsonResponse({"error": "user_text required for event_type=user_turn"}, status=400)
 
-    # store user msg (exactly one row per user answer)
-    if event_type == "user_turn":
-        InterviewMessage.objects.create(
-            session=session,
-            role=InterviewMessage.Role.USER,
-            stage=session.stage,
-            text=user_text,
-            is_final=True,
-            meta={"event_id": event_id} if event_id else {},
-        )
-        session.last_turn_at = now
-        session.save(update_fields=["last_turn_at", "updated_at"])
+    # (user msg is persisted together with the agent reply in _finish_turn —
+    # the engine receives user_text directly, so nothing reads the row first)
 
     # time-based fallback: force "timeout" into engine
     stage_started = session.stage_started_at or session.created_at
@@ -188,11 +426,7 @@ def _handle_next_turn(request, *, require_secret: bool):
     if session.stage == "experience" and elapsed_s >= settings.EXPERIENCE_TIMEOUT_S:
         engine_event_type = "timeout"
 
-    # load full history
-    history = list(session.messages.order_by("created_at").values("role", "stage", "text"))
-
-    # run Gemini engine
-    out = run_engine(
+    engine_kwargs = dict(
         session_id=str(session.id),
         candidate_name=session.candidate_name,
         role_name=session.role,
@@ -200,98 +434,144 @@ def _handle_next_turn(request, *, require_secret: bool):
         user_text=user_text,
         history=history,
         session_stage=session.stage,
+        summary=session.summary or "",
     )
 
-    assistant_text = out["assistant_text"]
-    next_stage = out["next_stage"]
-    done = bool(out["done"])
+    if background:
+        # run the whole turn (engine + persistence) detached from the client
+        async def run_turn():
+            out = await run_engine_async(**engine_kwargs)
+            assistant_text, next_stage, done = await _finish_turn(
+                session,
+                event_type=event_type,
+                user_text=user_text,
+                event_id=event_id,
+                engine_event_type=engine_event_type,
+                out=out,
+                now=now,
+            )
+            if not done:
+                _schedule_compaction(session.id)
+            return {"assistant_text": assistant_text, "stage": next_stage, "done": done}
+
+        task_id = uuid.uuid4().hex
+        _turn_task_put(task_id, asyncio.ensure_future(run_turn()))
+        return ORJsonResponse({"task_id": task_id}, status=202)
+
+    if stream:
+        # NDJSON stream: delta chunks as Gemini generates, then one final line.
+        # Persistence happens once the stream is fully drained.
+        async def event_stream():
+            final = None
+            async for event in run_engine_stream_async(**engine_kwargs):
+                if event["type"] == "delta":
+                    yield orjson.dumps({"type": "delta", "text": event["text"]}) + b"\n"
+                else:
+                    final = event
+            # final line goes out before the DB writes — persistence happens
+            # after the reply has fully left the building
+            yield orjson.dumps({"type": "final", "assistant_text": final["assistant_text"], "stage": final["next_stage"], "done": bool(final["done"])}) + b"\n"
+            await _finish_turn(
+                session,
+                event_type=event_type,
+                user_text=user_text,
+                event_id=event_id,
+                engine_event_type=engine_event_type,
+                out=final,
+                now=now,
+            )
+            if not final["done"]:
+                _schedule_compaction(session.id)
 
-    # store agent msg
-    InterviewMessage.objects.create(
-        session=session,
-        role=InterviewMessage.Role.AGENT,
-        stage=next_stage,
-        text=assistant_text,
-        is_final=True,
-        meta={"event_id": event_id, "engine_event_type": engine_event_type} if event_id else {"engine_event_type": engine_event_type},
-    )
+        return StreamingHttpResponse(event_stream(), content_type="application/x-ndjson")
 
-    # update stage timing if stage changed
-    stage_changed = (next_stage != session.stage)
-    session.stage = next_stage
-    if stage_changed:
-        session.stage_started_at = now
+    # run Gemini engine (buffered)
+    out = await run_engine_async(**engine_kwargs)
 
-    if done:
-        session.status = InterviewSession.Status.ENDED
-        session.ended_at = now
-        session.save(update_fields=["stage", "stage_started_at", "status", "ended_at", "updated_at"])
-    else:
-        session.save(update_fields=["stage", "stage_started_at", "updated_at"])
+    assistant_text, next_stage, done = await _finish_turn(
+        session,
+        event_type=event_type,
+        user_text=user_text,
+        event_id=event_id,
+        engine_event_type=engine_event_type,
+        out=out,
+        now=now,
+    )
+    if not done:
+        _schedule_compaction(session.id)
 
-    return JsonResponse({"assistant_text": assistant_text, "stage": next_stage, "done": done})
+    return ORJsonResponse({"assistant_text": assistant_text, "stage": next_stage, "done": done})
 
 
 @csrf_exempt
 @require_http_methods(["POST"])
-def next_turn(request):
-    # protected endpoint (for LiveKit Builder)
-    return _handle_next_turn(request, require_secret=True)
+async def next_turn(request):
+    # protected endpoint (for LiveKit Builder) — streams sentence chunks
+    return await _handle_next_turn(request, require_secret=True, stream=True)
 
 
 @csrf_exempt
 @require_http_methods(["POST"])
-def ui_next_turn(request):
+async def ui_next_turn(request):
     # DEBUG-only endpoint (for browser UI)
-    return _handle_next_turn(request, require_secret=False)
+    return await _handle_next_turn(request, require_secret=False)
+
+
+# Static per-candidate grant kwargs — only the room differs per session
+_VIDEO_GRANT_KWARGS = dict(
+    room_join=True,
+    can_publish=True,
+    can_subscribe=True,
+    can_publish_data=True,
+)
+
+# LiveKit tokens default to a 6h expiry; cache the signed JWT well below
+# that so page reloads for the same session skip the rebuild + re-sign
+_LK_TOKEN_CACHE_S = 3600
 
 
 @csrf_exempt
 @require_http_methods(["POST"])
-def livekit_token(request):
-    payload = json.loads(request.body.decode("utf-8") or "{}")
+async def livekit_token(request):
+    payload = orjson.loads(request.body or b"{}")
     session_id = (payload.get("session_id") or "").strip()
     if not session_id:
-        return JsonResponse({"error": "session_id is required"}, status=400)
+        return ORJsonResponse({"error": "session_id is required"}, status=400)
 
     try:
-        session = InterviewSession.objects.get(id=session_id)
+        session = await InterviewSession.objects.aget(id=session_id)
     except InterviewSession.DoesNotExist:
-        return JsonResponse({"error": "Unknown session_id"}, status=404)
-
-    # identity must be unique per participant
-    identity = f"cand-{session.id}"
-    agent_name = getattr(settings, "AGENT_NAME", "Taylor-23fe")
-
-    job_meta = json.dumps({
-    "session_id": str(session.id),
-    "candidate_name": session.candidate_name,
-    "role": session.role,
-     })
-
-    token = (
-        AccessToken(settings.LIVEKIT_API_KEY, settings.LIVEKIT_API_SECRET)
-        .with_identity(identity)
-        .with_name(session.candidate_name)
-        .with_metadata(json.dumps({"session_id": str(session.id)}))
-        .with_grants(
-            VideoGrants(
-                room_join=True,
-                room=session.room_name,
-                can_publish=True,
-                can_subscribe=True,
-                can_publish_data=True,
-            )
-        )
-        .with_room_config(
-            RoomConfiguration(
-                agents=[RoomAgentDispatch(agent_name=agent_name, metadata=job_meta)]
+        return ORJsonResponse({"error": "Unknown session_id"}, status=404)
+
+    cache_key = f"lk-token:{session.id}"
+    token = await cache.aget(cache_key)
+    if token is None:
+        # identity must be unique per participant
+        identity = f"cand-{session.id}"
+        agent_name = getattr(settings, "AGENT_NAME", "Taylor-23fe")
+
+        job_meta = orjson.dumps({
+            "session_id": str(session.id),
+            "candidate_name": session.candidate_name,
+            "role": session.role,
+        }).decode()
+
+        token = (
+            AccessToken(settings.LIVEKIT_API_KEY, settings.LIVEKIT_API_SECRET)
+            .with_identity(identity)
+            .with_name(session.candidate_name)
+            .with_metadata(orjson.dumps({"session_id": str(session.id)}).decode())
+            .with_grants(VideoGrants(room=session.room_name, **_VIDEO_GRANT_KWARGS))
+            .with_room_config(
+                RoomConfiguration(
+                    agents=[RoomAgentDispatch(agent_name=agent_name, metadata=job_meta)]
+                )
             )
+            .to_jwt()
         )
-        .to_jwt()
-    )
+        await cache.aset(cache_key, token, timeout=_LK_TOKEN_CACHE_S)
 
-    return JsonResponse({
+    return ORJsonResponse({
         "url": settings.LIVEKIT_URL,
         "room_name": session.room_name,
         "token": token,
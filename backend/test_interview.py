@@ -1,59 +1,92 @@
-"""Full end-to-end text interview test with REAL Gemini AI."""
-import requests, sys, time
+"""Full end-to-end text interview test with REAL Gemini AI.
+
+Fans out N concurrent candidates (default 3, override via argv) over one
+keep-alive aiohttp session — each candidate's turns stay strictly
+sequential, candidates run in parallel — and reports aggregate p50/p99
+turn latency on top of the per-candidate AI/fallback verdicts.
+"""
+import asyncio
+import re
+import sys
+import time
+
+import aiohttp
 
 BASE = "http://127.0.0.1:8000"
 
-def main():
-    print("=" * 70)
-    print("  REAL AI INTERVIEW TEST (gemini-2.5-flash)")
-    print("=" * 70)
+FALLBACKS = ["Hi Vansh! Welcome", "Thanks for joining", "That's great. What would",
+             "Interesting background!", "Nice! Let's dive", "Tell me more about the technical",
+             "What was the biggest challenge", "What impact did your work", "I'd love to hear"]
+# one anchored alternation instead of a startswith loop per response
+_FB = re.compile("^(?:" + "|".join(re.escape(f) for f in FALLBACKS) + ")")
+
+TURNS = [
+    ("start", ""),
+    ("user_turn", "I am Vansh, a Masters student in AI at University at Buffalo. Im in my second semester studying NLP and reinforcement learning."),
+    ("user_turn", "what"),
+    ("user_turn", "I was drawn to this role because I want to apply deep learning and transformers in real-world products."),
+    ("user_turn", "My strongest skills are Python, PyTorch, and transformer architectures. I also have experience with data pipelines and MLOps."),
+    ("user_turn", "What excites me most is the intersection of NLP and real-time systems. I built a real-time sentiment analysis tool for social media."),
+    ("user_turn", "For the sentiment project I was lead developer. I used fine-tuned DistilBERT deployed on AWS with Docker and FastAPI."),
+    ("user_turn", "We achieved 92 percent accuracy and handled 3000 tweets per second with p99 latency under 180ms."),
+]
 
-    r = requests.post(f"{BASE}/api/interview/sessions/create/", json={
+
+async def run_candidate(http: aiohttp.ClientSession, idx: int):
+    """One synthetic candidate: sequential turns, own session."""
+    async with http.post(f"{BASE}/api/interview/sessions/create/", json={
         "candidate_name": "Vansh",
         "role": "AI Algorithm Engineer Intern",
-    })
-    assert r.status_code == 201, f"Create failed: {r.status_code} {r.text}"
-    sid = r.json()["session_id"]
-    print(f"\nSession: {sid}\n")
-
-    turns = [
-        ("start", ""),
-        ("user_turn", "I am Vansh, a Masters student in AI at University at Buffalo. Im in my second semester studying NLP and reinforcement learning."),
-        ("user_turn", "what"),
-        ("user_turn", "I was drawn to this role because I want to apply deep learning and transformers in real-world products."),
-        ("user_turn", "My strongest skills are Python, PyTorch, and transformer architectures. I also have experience with data pipelines and MLOps."),
-        ("user_turn", "What excites me most is the intersection of NLP and real-time systems. I built a real-time sentiment analysis tool for social media."),
-        ("user_turn", "For the sentiment project I was lead developer. I used fine-tuned DistilBERT deployed on AWS with Docker and FastAPI."),
-        ("user_turn", "We achieved 92 percent accuracy and handled 3000 tweets per second with p99 latency under 180ms."),
-    ]
-
-    all_responses = []
-    FALLBACKS = ["Hi Vansh! Welcome", "Thanks for joining", "That's great. What would",
-                 "Interesting background!", "Nice! Let's dive", "Tell me more about the technical",
-                 "What was the biggest challenge", "What impact did your work", "I'd love to hear"]
-
-    for i, (evt, txt) in enumerate(turns):
+    }) as r:
+        assert r.status == 201, f"[cand {idx}] create failed: {r.status}"
+        sid = (await r.json())["session_id"]
+
+    responses, latencies = [], []
+    for i, (evt, txt) in enumerate(TURNS):
         payload = {"session_id": sid, "event_type": evt}
-        if txt: payload["user_text"] = txt
+        if txt:
+            payload["user_text"] = txt
         t0 = time.time()
-        r = requests.post(f"{BASE}/api/interview/ui/next_turn/", json=payload)
-        ms = int((time.time() - t0) * 1000)
-        assert r.status_code == 200, f"Turn {i} FAILED: {r.status_code}\n{r.text[:200]}"
-        d = r.json()
-        text, stage = d["assistant_text"], d["stage"]
-        all_responses.append(text)
-        src = "FALLBACK" if any(text.startswith(f) for f in FALLBACKS) else "AI"
-        if txt: print(f"  YOU: {txt[:80]}...")
-        print(f"  TAYLOR [{src}]: {text}")
-        print(f"  [{stage}] {ms}ms\n")
-
-    ai = sum(1 for t in all_responses if not any(t.startswith(f) for f in FALLBACKS))
-    dupes = len(all_responses) - len(set(t[:40] for t in all_responses))
-    combined = " ".join(all_responses).lower()
-    refs = [w for w in ["vansh","buffalo","nlp","pytorch","sentiment","distilbert","transformer"] if w in combined]
+        async with http.post(f"{BASE}/api/interview/ui/next_turn/", json=payload) as r:
+            assert r.status == 200, f"[cand {idx}] turn {i} failed: {r.status} {(await r.text())[:200]}"
+            d = await r.json()
+        latencies.append(time.time() - t0)
+        responses.append(d["assistant_text"])
+    return responses, latencies
+
+
+def report(all_responses, all_latencies, n_cands):
+    lat = sorted(all_latencies)
+    p50 = lat[len(lat) // 2]
+    p99 = lat[min(len(lat) - 1, int(len(lat) * 0.99))]
+
+    ok = True
+    for idx, responses in enumerate(all_responses):
+        ai = sum(1 for t in responses if not _FB.match(t))
+        dupes = len(responses) - len(set(t[:40] for t in responses))
+        combined = " ".join(responses).lower()
+        refs = [w for w in ["vansh", "buffalo", "nlp", "pytorch", "sentiment", "distilbert", "transformer"] if w in combined]
+        print(f"  cand {idx}: AI {ai}/{len(responses)} | Dupes: {dupes} | Refs: {refs}")
+        ok = ok and ai >= 4 and dupes == 0
+
+    print(f"  {n_cands} candidates x {len(TURNS)} turns | p50 {p50 * 1000:.0f}ms | p99 {p99 * 1000:.0f}ms")
+    print(f"  RESULT: {'PASS' if ok else 'FAIL'}")
+
+
+async def main():
+    n_cands = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    print("=" * 70)
+    print(f"  REAL AI INTERVIEW TEST (gemini-2.5-flash) — {n_cands} concurrent candidates")
     print("=" * 70)
-    print(f"  AI: {ai}/{len(all_responses)} | Dupes: {dupes} | Refs: {refs}")
-    print(f"  RESULT: {'PASS' if ai >= 4 and dupes == 0 else 'FAIL'}")
+
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=64)) as http:
+        results = await asyncio.gather(*(run_candidate(http, i) for i in range(n_cands)))
+
+    all_responses = [responses for responses, _ in results]
+    all_latencies = [l for _, latencies in results for l in latencies]
+    print("=" * 70)
+    report(all_responses, all_latencies, n_cands)
+
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())